@@ -65,8 +65,8 @@ class AclSetUser(Command):
         callbacks = []
 
         root_permission_role = []
-        while self.rules:
-            rule = self.rules.pop(0)
+        rules = iter(self.rules)
+        for rule in rules:
             if rule == b"resetkeys":
                 callbacks.append(ACLUser.reset_keys)
                 continue
@@ -92,8 +92,8 @@ class AclSetUser(Command):
                 full_rule = rule
                 while not full_rule.endswith(b")"):
                     try:
-                        full_rule += b" " + self.rules.pop(0)
-                    except IndexError:
+                        full_rule += b" " + next(rules)
+                    except StopIteration:
                         raise ServerError(b"ERR Unmatched parenthesis in acl selector starting at '" + rule + b"'.")
 
                 try:
@@ -13,7 +13,7 @@ from pyvalkey.commands.router import ServerCommandsRouter
 from pyvalkey.resp import RESP_OK, RespError, ValueType
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientCommand(Command):
     client_context: ClientContext = server_command_dependency()
 
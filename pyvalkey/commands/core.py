@@ -3,25 +3,26 @@ from typing import Any, Self
 
 from pyvalkey.commands.context import ClientContext
 from pyvalkey.commands.dependencies import server_command_dependency
+from pyvalkey.commands.parsers import ParametersCursor
 from pyvalkey.database_objects.databases import Database
 from pyvalkey.resp import ValueType
 
 
-@dataclass
+@dataclass(slots=True)
 class Command:
     def execute(self) -> ValueType:
         raise NotImplementedError()
 
     @staticmethod
-    def parse(parameters: list[bytes]) -> dict[str, Any]:
+    def parse(parameters: list[bytes] | ParametersCursor) -> dict[str, Any]:
         raise NotImplementedError()
 
     @classmethod
-    def create(cls, parameters: list[bytes], client_context: ClientContext) -> Self:
+    def create(cls, parameters: ParametersCursor, client_context: ClientContext) -> Self:
         raise NotImplementedError()
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseCommand(Command):
     database: Database = server_command_dependency()
 
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import Field, dataclass, fields
+from dataclasses import dataclass, fields
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Self, get_type_hints
+from typing import TYPE_CHECKING, Any, Self, get_type_hints
 
 from pyvalkey.commands.context import ClientContext, ServerContext
 from pyvalkey.database_objects.acl import ACL
@@ -13,37 +13,35 @@ from pyvalkey.database_objects.information import Information
 
 if TYPE_CHECKING:
     from pyvalkey.commands.core import Command
+    from pyvalkey.commands.parsers import ParametersCursor
 
 
 class DependencyMetadata(Enum):
     DEPENDENCY = auto()
 
 
+DEPENDENCIES_RESOLVERS: dict[type, Callable[[ClientContext], Any]] = {
+    Database: lambda client_context: client_context.database,
+    ACL: lambda client_context: client_context.server_context.acl,
+    ClientContext: lambda client_context: client_context,
+    ServerContext: lambda client_context: client_context.server_context,
+    Information: lambda client_context: client_context.server_context.information,
+    Configurations: lambda client_context: client_context.server_context.configurations,
+}
+
+
 @dataclass
 class CommandCreator:
     command_cls: type[Command]
+    command_parser: Callable[[ParametersCursor], dict[str, Any]]
     command_creator: Callable[..., Command]
-    dependencies: list[Field]
-    dependencies_types: list[Field]
-
-    def __call__(self, parameters: list[bytes], client_context: ClientContext) -> Command:
-        command_kwargs = self.command_cls.parse(parameters)
-
-        for command_dependency, command_dependency_type in zip(self.dependencies, self.dependencies_types):
-            if command_dependency_type == Database:
-                command_kwargs[command_dependency.name] = client_context.database
-            elif command_dependency_type == ACL:
-                command_kwargs[command_dependency.name] = client_context.server_context.acl
-            elif command_dependency_type == ClientContext:
-                command_kwargs[command_dependency.name] = client_context
-            elif command_dependency_type == ServerContext:
-                command_kwargs[command_dependency.name] = client_context.server_context
-            elif command_dependency_type == Information:
-                command_kwargs[command_dependency.name] = client_context.server_context.information
-            elif command_dependency_type == Configurations:
-                command_kwargs[command_dependency.name] = client_context.server_context.configurations
-            else:
-                raise TypeError()
+    dependencies: list[tuple[str, Callable[[ClientContext], Any]]]
+
+    def __call__(self, parameters: ParametersCursor, client_context: ClientContext) -> Command:
+        command_kwargs = self.command_parser(parameters)
+
+        for command_dependency_name, command_dependency_resolver in self.dependencies:
+            command_kwargs[command_dependency_name] = command_dependency_resolver(client_context)
 
         return self.command_creator(**command_kwargs)
 
@@ -52,12 +50,14 @@ class CommandCreator:
         field_types = get_type_hints(command_cls)
 
         command_dependencies = []
-        command_dependencies_types = []
         for command_dependency in fields(command_cls):
             if not command_dependency.metadata.get(DependencyMetadata.DEPENDENCY):
                 continue
 
-            command_dependencies.append(command_dependency)
-            command_dependencies_types.append(field_types[command_dependency.name])
+            command_dependency_resolver = DEPENDENCIES_RESOLVERS.get(field_types[command_dependency.name])
+            if command_dependency_resolver is None:
+                raise TypeError(field_types[command_dependency.name])
+
+            command_dependencies.append((command_dependency.name, command_dependency_resolver))
 
-        return cls(command_cls, command_cls, command_dependencies, command_dependencies_types)
+        return cls(command_cls, command_cls.parse, command_cls, command_dependencies)
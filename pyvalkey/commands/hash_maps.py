@@ -1,6 +1,6 @@
+from pyvalkey.commands.core import DatabaseCommand
 from pyvalkey.commands.parameters import positional_parameter
 from pyvalkey.commands.router import ServerCommandsRouter
-from pyvalkey.commands.strings_commands import DatabaseCommand
 from pyvalkey.database_objects.databases import Database
 from pyvalkey.database_objects.errors import ServerInvalidIntegerError
 from pyvalkey.resp import RESP_OK, ValueType
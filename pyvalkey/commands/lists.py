@@ -1,8 +1,8 @@
 from enum import Enum
 
+from pyvalkey.commands.core import DatabaseCommand
 from pyvalkey.commands.parameters import positional_parameter
 from pyvalkey.commands.router import ServerCommandsRouter
-from pyvalkey.commands.strings_commands import DatabaseCommand
 from pyvalkey.commands.utils import parse_range_parameters
 from pyvalkey.resp import ValueType
 
@@ -101,7 +101,10 @@ class ListPop(DatabaseCommand):
         if not a_list:
             return None
         if self.count:
-            return [a_list.pop(0) for _ in range(min(len(a_list), self.count))]
+            count = max(self.count, 0)
+            popped = a_list[:count]
+            del a_list[:count]
+            return popped
         return a_list.pop(0)
 
 
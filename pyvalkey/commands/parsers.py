@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from collections.abc import Callable
 from dataclasses import MISSING, Field, dataclass, field, fields, is_dataclass
 from enum import Enum
@@ -8,6 +9,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, Self, Union, get_args, get_orig
 
 from pyvalkey.commands.creators import CommandCreator
 from pyvalkey.commands.parameters import ParameterMetadata
+from pyvalkey.commands.utils import parse_float
 from pyvalkey.database_objects.errors import (
     ServerError,
     ServerWrongNumberOfArgumentsError,
@@ -18,23 +20,63 @@ if TYPE_CHECKING:
     from pyvalkey.commands.core import Command
 
 
+_NONE_TYPE = type(None)
+
+
+def _casefold_keys(mapping: dict[Any, Any]) -> dict[Any, Any]:
+    casefolded_mapping = {}
+    for key, value in mapping.items():
+        if isinstance(key, bytes):
+            casefolded_mapping[key.lower()] = value
+            key = key.upper()
+        casefolded_mapping[key] = value
+    return casefolded_mapping
+
+
+class ParametersCursor:
+    __slots__ = ("index", "parameters")
+
+    def __init__(self, parameters: list[bytes], index: int = 0) -> None:
+        self.parameters = parameters
+        self.index = index
+
+    def __len__(self) -> int:
+        return len(self.parameters) - self.index
+
+    def peek(self) -> bytes:
+        return self.parameters[self.index]
+
+    def next(self) -> bytes:
+        parameter = self.parameters[self.index]
+        self.index += 1
+        return parameter
+
+    def rest(self) -> list[bytes]:
+        parameters = self.parameters[self.index :]
+        self.index = len(self.parameters)
+        return parameters
+
+
 class ParameterParser:
+    __slots__ = ()
+
     @classmethod
-    def next_parameter(cls, parameters: list[bytes]) -> bytes:
+    def next_parameter(cls, parameters: ParametersCursor) -> bytes:
         try:
-            return parameters.pop(0)
+            return parameters.next()
         except IndexError:
             raise ServerWrongNumberOfArgumentsError()
 
-    def parse(self, parameters: list[bytes]) -> Any:  # noqa: ANN401
+    def parse(self, parameters: ParametersCursor) -> Any:  # noqa: ANN401
         return self.next_parameter(parameters)
 
     @classmethod
+    @functools.cache
     def _extract_optional_type(cls, parameter_type: Any) -> Any:  # noqa: ANN401
         if get_origin(parameter_type) == Union or get_origin(parameter_type) == UnionType:
-            args = get_args(parameter_type)
-            items = set([arg for arg in args if arg is not type(None)])
-            if len(items) > 1:
+            items = set(get_args(parameter_type))
+            items.discard(_NONE_TYPE)
+            if len(items) != 1:
                 raise TypeError(items)
             parameter_type = items.pop()
         return parameter_type
@@ -42,6 +84,7 @@ class ParameterParser:
     @classmethod
     def create(cls, parameter_field: Field, parameter_type: Any) -> ParameterParser:  # noqa: ANN401
         parameter_type = cls._extract_optional_type(parameter_type)
+        metadata = parameter_field.metadata
 
         if isinstance(parameter_type, type) and issubclass(parameter_type, Enum):
             return EnumParameterParser(parameter_type)
@@ -49,60 +92,61 @@ class ParameterParser:
         if is_dataclass(parameter_type):
             return ObjectParser.create_from_object(parameter_type)
 
-        match parameter_type():
-            case bytes():
-                if parameter_field.metadata.get(ParameterMetadata.KEY_MODE, False):
-                    return KeyParameterParser()
-                return ParameterParser()
-            case bool():
-                return BoolParameterParser(
-                    parameter_field.metadata.get(
-                        ParameterMetadata.VALUES_MAPPING, BoolParameterParser.DEFAULT_VALUES_MAPPING
-                    )
-                )
-            case int():
-                return IntParameterParser()
-            case float():
-                return FloatParameterParser()
-            case list():
-                return ListParameterParser.create_from_list_type(get_args(parameter_type)[0])
-            case set():
-                return SetParameterParser.create_from_type(get_args(parameter_type)[0])
-            case tuple():
-                return TupleParameterParser.create_from_tuple_types(get_args(parameter_type))
-            case default:
-                raise TypeError(default)
+        if parameter_type is bytes and metadata.get(ParameterMetadata.KEY_MODE, False):
+            return _KEY_PARAMETER_PARSER
+
+        if parameter_type is bool:
+            values_mapping = metadata.get(ParameterMetadata.VALUES_MAPPING)
+            if values_mapping is None:
+                return _BOOL_PARAMETER_PARSER
+            return BoolParameterParser(values_mapping)
+
+        return cls.create_from_element_type(parameter_type)
+
+    @classmethod
+    def create_from_element_type(cls, element_type: Any) -> ParameterParser:  # noqa: ANN401
+        parameter_parser_factory = PARAMETER_PARSER_FACTORIES.get(get_origin(element_type) or element_type)
+        if parameter_parser_factory is None:
+            raise TypeError(element_type)
+        return parameter_parser_factory(element_type)
 
 
 class KeyParameterParser(ParameterParser):
-    def parse(self, parameters: list[bytes]) -> Any:  # noqa: ANN401
+    __slots__ = ()
+
+    def parse(self, parameters: ParametersCursor) -> Any:  # noqa: ANN401
         return self.next_parameter(parameters)
 
 
 class ParametersGroup(ParameterParser):
-    def parse(self, parameters: list[bytes]) -> Any:  # noqa: ANN401
+    __slots__ = ()
+
+    def parse(self, parameters: ParametersCursor) -> Any:  # noqa: ANN401
         raise NotImplementedError()
 
 
-@dataclass
+@dataclass(slots=True)
 class NamedParameterParser(ParameterParser):
     name: str
     parameter_parser: ParameterParser
 
-    def parse(self, parameters: list[bytes]) -> dict[str, Any]:
+    def parse(self, parameters: ParametersCursor) -> dict[str, Any]:
         return {self.name: self.parameter_parser.parse(parameters)}
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionalNamedParameterParser(NamedParameterParser):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ListParameterParser(ParameterParser):
     parameter_parser: ParameterParser
 
-    def parse(self, parameters: list[bytes]) -> list:
+    def parse(self, parameters: ParametersCursor) -> list:
+        if self.parameter_parser is _BYTES_PARAMETER_PARSER:
+            return parameters.rest()
+
         list_parameter = []
         while parameters:
             list_parameter.append(self.parameter_parser.parse(parameters))
@@ -110,22 +154,14 @@ class ListParameterParser(ParameterParser):
 
     @classmethod
     def create_from_list_type(cls, list_type: Any) -> Self:  # noqa: ANN401
-        match list_type():
-            case bytes():
-                return cls(ParameterParser())
-            case int():
-                return cls(IntParameterParser())
-            case tuple():
-                return cls(TupleParameterParser.create_from_tuple_types(get_args(list_type)))
-            case default:
-                raise TypeError(default)
-
-
-@dataclass
+        return cls(cls.create_from_element_type(list_type))
+
+
+@dataclass(slots=True)
 class SetParameterParser(ParameterParser):
     parameter_parser: ParameterParser
 
-    def parse(self, parameters: list[bytes]) -> set:
+    def parse(self, parameters: ParametersCursor) -> set:
         set_value = set()
         while parameters:
             set_value.add(self.parameter_parser.parse(parameters))
@@ -133,41 +169,25 @@ class SetParameterParser(ParameterParser):
 
     @classmethod
     def create_from_type(cls, set_type: Any) -> Self:  # noqa: ANN401
-        match set_type():
-            case bytes():
-                return cls(ParameterParser())
-            case int():
-                return cls(IntParameterParser())
-            case default:
-                raise TypeError(default)
+        return cls(cls.create_from_element_type(set_type))
 
 
-@dataclass
+@dataclass(slots=True)
 class TupleParameterParser(ParameterParser):
     parameter_parser_tuple: tuple[ParameterParser, ...]
 
-    def parse(self, parameters: list[bytes]) -> tuple:
-        tuple_parameter = []
-        for parameter_parser in self.parameter_parser_tuple:
-            tuple_parameter.append(parameter_parser.parse(parameters))
-        return tuple(tuple_parameter)
+    def parse(self, parameters: ParametersCursor) -> tuple:
+        return tuple([parameter_parser.parse(parameters) for parameter_parser in self.parameter_parser_tuple])
 
     @classmethod
     def create_from_tuple_types(cls, tuple_types: tuple[Any, ...]) -> Self:
-        parameter_parser_tuple = []
-        for arg in tuple_types:
-            match arg():
-                case bytes():
-                    parameter_parser_tuple.append(ParameterParser())
-                case int():
-                    parameter_parser_tuple.append(IntParameterParser())
-                case _:
-                    raise TypeError()
-        return cls(tuple(parameter_parser_tuple))
+        return cls(tuple([cls.create_from_element_type(tuple_type) for tuple_type in tuple_types]))
 
 
 class IntParameterParser(ParameterParser):
-    def parse(self, parameters: list[bytes]) -> int:
+    __slots__ = ()
+
+    def parse(self, parameters: ParametersCursor) -> int:
         try:
             return int(self.next_parameter(parameters))
         except ValueError:
@@ -175,53 +195,79 @@ class IntParameterParser(ParameterParser):
 
 
 class FloatParameterParser(ParameterParser):
-    def parse(self, parameters: list[bytes]) -> float:
+    __slots__ = ()
+
+    def parse(self, parameters: ParametersCursor) -> float:
         try:
-            return float(self.next_parameter(parameters))
+            return parse_float(self.next_parameter(parameters))
         except ValueError:
             raise ServerError(b"ERR value is not a valid float")
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumParameterParser(ParameterParser):
     enum_cls: type[Enum]
 
-    def parse(self, parameters: list[bytes]) -> Enum:
-        enum_value = self.next_parameter(parameters).upper()
-        try:
-            return self.enum_cls(enum_value)
-        except ValueError as e:
-            raise ValkeySyntaxError(enum_value) from e
+    values_to_members: dict[Any, Enum] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.values_to_members = _casefold_keys({member.value: member for member in self.enum_cls})
 
+    def parse(self, parameters: ParametersCursor) -> Enum:
+        enum_value = self.next_parameter(parameters)
+        member = self.values_to_members.get(enum_value)
+        if member is None:
+            enum_value = enum_value.upper()
+            member = self.values_to_members.get(enum_value)
+            if member is None:
+                raise ValkeySyntaxError(enum_value)
+        return member
 
-@dataclass
+
+@dataclass(slots=True)
 class BoolParameterParser(ParameterParser):
-    DEFAULT_VALUES_MAPPING: ClassVar = {b"1": True, b"0": False}
+    DEFAULT_VALUES_MAPPING: ClassVar[dict[bytes, bool]] = {b"1": True, b"0": False}
+
+    values_mapping: dict[bytes, bool]
 
-    values_mapping: dict[bytes, bool] = field(default_factory=lambda: BoolParameterParser.DEFAULT_VALUES_MAPPING)
+    def __post_init__(self) -> None:
+        self.values_mapping = _casefold_keys(self.values_mapping)
 
-    def parse(self, parameters: list[bytes]) -> bool:
-        bytes_value = self.next_parameter(parameters).upper()
-        if bytes_value not in self.values_mapping:
-            raise ValkeySyntaxError(bytes_value)
-        return self.values_mapping[bytes_value]
+    def parse(self, parameters: ParametersCursor) -> bool:
+        bytes_value = self.next_parameter(parameters)
+        value = self.values_mapping.get(bytes_value)
+        if value is None:
+            bytes_value = bytes_value.upper()
+            value = self.values_mapping.get(bytes_value)
+            if value is None:
+                raise ValkeySyntaxError(bytes_value)
+        return value
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionalKeywordParametersGroup(ParametersGroup):
     parameters_parsers_map: dict[bytes, tuple[NamedParameterParser, bool]]
 
-    def parse(self, parameters: list[bytes]) -> dict[str, Any]:
+    def parse(self, parameters: ParametersCursor) -> dict[str, Any]:
         parsed_kw_parameters: dict[str, Any] = {}
+        parameters_parsers_map = self.parameters_parsers_map
 
         while parameters:
-            top_parameter = parameters[0].upper()
-            if top_parameter not in self.parameters_parsers_map:
+            top_parameter = parameters.peek()
+            keyword_parser = parameters_parsers_map.get(top_parameter)
+            if (
+                keyword_parser is None
+                and top_parameter[:1].isalpha()
+                and not top_parameter.isupper()
+                and not top_parameter.islower()
+            ):
+                keyword_parser = parameters_parsers_map.get(top_parameter.upper())
+            if keyword_parser is None:
                 return parsed_kw_parameters
-            parameter, is_keyword = self.parameters_parsers_map[top_parameter]
+            parameter, is_keyword = keyword_parser
 
             if is_keyword:
-                parameters.pop(0)
+                parameters.next()
 
             if parameter.name in parsed_kw_parameters:
                 raise ValkeySyntaxError()
@@ -229,32 +275,46 @@ class OptionalKeywordParametersGroup(ParametersGroup):
 
         return parsed_kw_parameters
 
+    @classmethod
+    def create_from_keywords_map(cls, parameters_parsers_map: dict[bytes, tuple[NamedParameterParser, bool]]) -> Self:
+        return cls(_casefold_keys(parameters_parsers_map))
 
-@dataclass
+
+@dataclass(slots=True)
 class ObjectParametersParser(ParametersGroup):
     parameters_parsers: list[ParameterParser]
 
+    non_optional_parameters: int = field(init=False, repr=False)
+    parsing_plan: list[tuple[ParameterParser, bool, dict | None]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.non_optional_parameters = sum(1 for p in self.parameters_parsers if not self._is_optional(p))
+
+        self.parsing_plan = []
+        for index, parameter_parser in enumerate(self.parameters_parsers):
+            next_keywords_map = None
+            if index + 1 < len(self.parameters_parsers):
+                next_parameters_parser = self.parameters_parsers[index + 1]
+                if isinstance(next_parameters_parser, OptionalKeywordParametersGroup):
+                    next_keywords_map = next_parameters_parser.parameters_parsers_map
+            self.parsing_plan.append((parameter_parser, self._is_optional(parameter_parser), next_keywords_map))
+
     @classmethod
     def _is_optional(cls, parameter_parser: ParameterParser) -> bool:
         return isinstance(parameter_parser, OptionalKeywordParametersGroup | OptionalNamedParameterParser)
 
-    def parse(self, parameters: list[bytes]) -> Any:  # noqa: ANN401
+    def parse(self, parameters: ParametersCursor) -> Any:  # noqa: ANN401
         parsed_parameters: dict[str, Any] = {}
 
-        non_optional_parameters = sum(1 for p in self.parameters_parsers if not self._is_optional(p))
+        non_optional_parameters = self.non_optional_parameters
 
-        for index, parameter_parser in enumerate(self.parameters_parsers):
-            if self._is_optional(parameter_parser):
+        for index, (parameter_parser, is_optional, next_keywords_map) in enumerate(self.parsing_plan):
+            if is_optional:
                 if len(parameters) <= (non_optional_parameters - index):
                     continue
 
-                if index + 1 < len(self.parameters_parsers):
-                    next_parameters_parser = self.parameters_parsers[index + 1]
-                    if (
-                        isinstance(next_parameters_parser, OptionalKeywordParametersGroup)
-                        and parameters[0] in next_parameters_parser.parameters_parsers_map
-                    ):
-                        continue
+                if next_keywords_map is not None and parameters and parameters.peek() in next_keywords_map:
+                    continue
 
             parsed_parameters.update(parameter_parser.parse(parameters))
 
@@ -263,18 +323,22 @@ class ObjectParametersParser(ParametersGroup):
 
         return parsed_parameters
 
-    def __call__(self, parameters: list[bytes]) -> Any:  # noqa: ANN401
-        return self.parse(list(parameters))
+    def __call__(self, parameters: list[bytes] | ParametersCursor) -> Any:  # noqa: ANN401
+        if not isinstance(parameters, ParametersCursor):
+            parameters = ParametersCursor(parameters)
+        return self.parse(parameters)
 
     @classmethod
     def create_from_object(cls, object_cls: Any) -> Self:  # noqa: ANN401
         resolved_hints = get_type_hints(object_cls)
 
-        parameter_fields = {
-            parameter_field.name: parameter_field
-            for parameter_field in fields(object_cls)
-            if parameter_field.metadata.get(ParameterMetadata.SERVER_PARAMETER)
-        }
+        parameter_fields = {}
+        parameter_flags = {}
+        for parameter_field in fields(object_cls):
+            metadata = parameter_field.metadata
+            if metadata.get(ParameterMetadata.SERVER_PARAMETER):
+                parameter_fields[parameter_field.name] = parameter_field
+                parameter_flags[parameter_field.name] = metadata.get(ParameterMetadata.FLAG)
         parameter_fields_by_order = list(parameter_fields.keys())
         if hasattr(object_cls, "__original_order__"):
             parameter_fields_by_order = list(getattr(object_cls, "__original_order__"))
@@ -284,7 +348,7 @@ class ObjectParametersParser(ParametersGroup):
         optional_keyword_parameters = {}
         for parameter_field_name in parameter_fields_by_order:
             parameter_field = parameter_fields[parameter_field_name]
-            flag = parameter_field.metadata.get(ParameterMetadata.FLAG)
+            flag = parameter_flags[parameter_field_name]
             if flag:
                 named_parameter_parser = NamedParameterParser(
                     parameter_field_name, ParameterParser.create(parameter_field, resolved_hints[parameter_field.name])
@@ -299,7 +363,9 @@ class ObjectParametersParser(ParametersGroup):
                         optional_keyword_parameters[flag] = named_parameter_parser, True
             else:
                 if optional_keyword_parameters:
-                    parameters_parsers.append(OptionalKeywordParametersGroup(optional_keyword_parameters))
+                    parameters_parsers.append(
+                        OptionalKeywordParametersGroup.create_from_keywords_map(optional_keyword_parameters)
+                    )
                     optional_keyword_parameters = {}
 
                 if parameter_field.default != MISSING:
@@ -318,24 +384,42 @@ class ObjectParametersParser(ParametersGroup):
                     )
 
         if optional_keyword_parameters:
-            parameters_parsers.append(OptionalKeywordParametersGroup(optional_keyword_parameters))
+            parameters_parsers.append(
+                OptionalKeywordParametersGroup.create_from_keywords_map(optional_keyword_parameters)
+            )
 
         return cls(parameters_parsers)
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectParser(ParametersGroup):
     object_cls: Any
     object_parameters_parser: ObjectParametersParser
 
-    def parse(self, parameters: list[bytes]) -> Any:  # noqa: ANN401
-        return self.object_cls(self.object_parameters_parser.parse(parameters))
+    def parse(self, parameters: ParametersCursor) -> Any:  # noqa: ANN401
+        return self.object_cls(**self.object_parameters_parser.parse(parameters))
 
     @classmethod
     def create_from_object(cls, object_cls: Any) -> Self:  # noqa: ANN401
         return cls(object_cls, ObjectParametersParser.create_from_object(object_cls))
 
 
+_BYTES_PARAMETER_PARSER = ParameterParser()
+_KEY_PARAMETER_PARSER = KeyParameterParser()
+_INT_PARAMETER_PARSER = IntParameterParser()
+_FLOAT_PARAMETER_PARSER = FloatParameterParser()
+_BOOL_PARAMETER_PARSER = BoolParameterParser(BoolParameterParser.DEFAULT_VALUES_MAPPING)
+
+PARAMETER_PARSER_FACTORIES: dict[Any, Callable[[Any], ParameterParser]] = {
+    bytes: lambda _: _BYTES_PARAMETER_PARSER,
+    int: lambda _: _INT_PARAMETER_PARSER,
+    float: lambda _: _FLOAT_PARAMETER_PARSER,
+    list: lambda list_type: ListParameterParser.create_from_list_type(get_args(list_type)[0]),
+    set: lambda set_type: SetParameterParser.create_from_type(get_args(set_type)[0]),
+    tuple: lambda tuple_type: TupleParameterParser.create_from_tuple_types(get_args(tuple_type)),
+}
+
+
 def _server_command_wrapper(command_cls: type[Command]) -> type[Command]:
     original_order = []
 
@@ -363,7 +447,7 @@ def _server_command_wrapper(command_cls: type[Command]) -> type[Command]:
         delattr(command_cls, name)
         setattr(command_cls, name, value)
 
-    command_cls = dataclass(command_cls)
+    command_cls = dataclass(command_cls, slots=True)
 
     setattr(command_cls, "__original_order__", original_order)
     setattr(command_cls, "parse", ObjectParametersParser.create_from_object(command_cls))
@@ -1,44 +1,50 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import fields
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from pyvalkey.commands.parsers import server_command
+from pyvalkey.commands.parameters import ParameterMetadata
+from pyvalkey.commands.parsers import ParametersCursor, server_command
 from pyvalkey.database_objects.acl import ACL
-from pyvalkey.database_objects.errors import RouterKeyError
 
 if TYPE_CHECKING:
     from pyvalkey.commands.context import ClientContext
     from pyvalkey.commands.core import Command
 
 
-@dataclass
 class ServerCommandsRouter:
-    ROUTES: ClassVar[defaultdict[bytes, Any]] = defaultdict(dict)
+    __slots__ = ()
+
+    ROUTES: ClassVar[dict[bytes, Any]] = {}
 
     def internal_route(
         self,
-        parameters: list[bytes],
+        parameters: ParametersCursor,
         routes: dict[bytes, type[Command]] | dict[bytes, type[Command] | dict[bytes, type[Command]]],
-    ) -> type[Command]:
-        command = parameters.pop(0).lower()
-
-        if command not in routes:
-            raise RouterKeyError()
-
-        routed_command = routes[command]
-
-        if isinstance(routed_command, dict):
-            return self.internal_route(parameters, routed_command)
+    ) -> type[Command] | None:
+        routed_command: Any = routes
+        while isinstance(routed_command, dict):
+            if not parameters:
+                return None
+            command = parameters.next()
+
+            routes = routed_command
+            routed_command = routes.get(command)
+            if routed_command is None and command[:1].isalpha() and not command.islower() and not command.isupper():
+                routed_command = routes.get(command.lower())
+            if routed_command is None:
+                return None
 
         return routed_command
 
-    def route(self, parameters: list[bytes], client_context: ClientContext) -> Command:
-        routed_command: type[Command] = self.internal_route(parameters, self.ROUTES)
+    def route(self, parameters: list[bytes], client_context: ClientContext) -> Command | None:
+        parameters_cursor = ParametersCursor(parameters)
+        routed_command = self.internal_route(parameters_cursor, self.ROUTES)
+        if routed_command is None:
+            return None
 
-        return routed_command.create(parameters, client_context)
+        return routed_command.create(parameters_cursor, client_context)
 
     @classmethod
     def command(
@@ -52,17 +58,24 @@ class ServerCommandsRouter:
 
             command_name = parent_command + b"|" + command if parent_command else command
 
-            ACL.COMMAND_CATEGORIES[command_name] = set(acl_categories)
+            ACL.COMMAND_CATEGORIES[command_name] = frozenset(acl_categories)
             for acl_category in acl_categories:
-                ACL.CATEGORIES[acl_category].add(command)
+                ACL.CATEGORIES.setdefault(acl_category, set()).add(command_name)
 
             ACL.COMMANDS_NAMES[command_cls] = command_name
+            ACL.COMMANDS_KEY_FIELDS[command_cls] = tuple(
+                (command_field.name, command_field.metadata[ParameterMetadata.KEY_MODE])
+                for command_field in fields(command_cls)
+                if command_field.metadata.get(ParameterMetadata.KEY_MODE, None)
+            )
 
+            routes = cls.ROUTES
             if parent_command is not None:
-                sub_route = cls.ROUTES[parent_command]
-                sub_route[command] = command_cls
-            else:
-                cls.ROUTES[command] = command_cls
+                routes = cls.ROUTES.setdefault(parent_command.lower(), {})
+                cls.ROUTES[parent_command.upper()] = routes
+
+            routes[command.lower()] = command_cls
+            routes[command.upper()] = command_cls
 
             return command_cls
 
@@ -1,7 +1,6 @@
-from dataclasses import dataclass
-from hashlib import sha256
+import hmac
 
-from pyvalkey.commands.context import ClientContext, ServerContext
+from pyvalkey.commands.context import ClientContext
 from pyvalkey.commands.core import Command
 from pyvalkey.commands.dependencies import server_command_dependency
 from pyvalkey.commands.parameters import positional_parameter
@@ -9,17 +8,10 @@ from pyvalkey.commands.router import ServerCommandsRouter
 from pyvalkey.database_objects.acl import ACL
 from pyvalkey.database_objects.configurations import Configurations
 from pyvalkey.database_objects.errors import ServerError
+from pyvalkey.database_objects.utils import hash_password
 from pyvalkey.resp import RESP_OK, RespError, ValueType
 
 
-@dataclass
-class ServerCommand(Command):
-    server_context: ServerContext
-
-    def execute(self) -> ValueType:
-        raise NotImplementedError()
-
-
 @ServerCommandsRouter.command(b"auth", [b"fast", b"connection"])
 class Authorize(Command):
     acl: ACL = server_command_dependency()
@@ -30,11 +22,11 @@ class Authorize(Command):
     password: bytes = positional_parameter()
 
     def execute(self) -> ValueType:
-        password_hash = sha256(self.password).hexdigest().encode()
+        password_hash = hash_password(self.password)
         if self.username is not None:
             if self.username not in self.acl:
                 raise ServerError(b"WRONGPASS invalid username-password pair or user is disabled.")
-            if self.username == b"default" and password_hash == self.configurations.requirepass:
+            if self.username == b"default" and hmac.compare_digest(password_hash, self.configurations.requirepass):
                 return RESP_OK
             acl_user = self.acl[self.username]
             if not acl_user.is_no_password_user and password_hash not in acl_user.passwords:
@@ -42,7 +34,7 @@ class Authorize(Command):
             self.client_context.current_user = acl_user
             return RESP_OK
 
-        if self.configurations.requirepass and password_hash == self.configurations.requirepass:
+        if self.configurations.requirepass and hmac.compare_digest(password_hash, self.configurations.requirepass):
             return RESP_OK
         raise ServerError(
             b"ERR AUTH "
@@ -1,10 +1,10 @@
-import functools
 from collections.abc import Callable
 
+from pyvalkey.commands.core import DatabaseCommand
 from pyvalkey.commands.parameters import positional_parameter
 from pyvalkey.commands.router import ServerCommandsRouter
-from pyvalkey.commands.strings_commands import DatabaseCommand
-from pyvalkey.database_objects.databases import Database
+from pyvalkey.database_objects.databases import Database, KeyValue
+from pyvalkey.database_objects.errors import ServerError
 from pyvalkey.resp import ValueType
 
 
@@ -27,11 +27,11 @@ class SetMove(DatabaseCommand):
 @ServerCommandsRouter.command(b"smismember", [b"read", b"set", b"slow"])
 class SetAreMembers(DatabaseCommand):
     key: bytes = positional_parameter()
-    members: set[bytes] = positional_parameter()
+    members: list[bytes] = positional_parameter()
 
     def execute(self) -> ValueType:
         a_set = self.database.get_set(self.key)
-        return list(map(lambda m: m in a_set, self.members))
+        return [member in a_set for member in self.members]
 
 
 @ServerCommandsRouter.command(b"sismember", [b"read", b"set", b"fast"])
@@ -67,8 +67,7 @@ class SetAdd(DatabaseCommand):
     def execute(self) -> ValueType:
         a_set = self.database.get_or_create_set(self.key)
         length_before = len(a_set)
-        for member in self.members:
-            a_set.add(member)
+        a_set.update(self.members)
         return len(a_set) - length_before
 
 
@@ -78,9 +77,11 @@ class SetPop(DatabaseCommand):
     count: int = positional_parameter(default=None)
 
     def execute(self) -> ValueType:
-        a_set = self.database.get_set(self.key).pop()
+        a_set = self.database.get_set(self.key)
         if self.count is None:
             return a_set.pop() if a_set else None
+        if self.count < 0:
+            raise ServerError(b"ERR value is out of range, must be positive")
         return [a_set.pop() for _ in range(min(len(a_set), self.count))]
 
 
@@ -91,12 +92,16 @@ class SetRemove(DatabaseCommand):
 
     def execute(self) -> ValueType:
         a_set = self.database.get_set(self.key)
+        length_before = len(a_set)
         a_set.difference_update(self.members)
-        return len(a_set.intersection(self.members))
+        return length_before - len(a_set)
 
 
-def apply_set_operation(database: Database, operation: Callable[[set, set], set], keys: list[bytes]) -> list:
-    return list(functools.reduce(operation, map(database.get_set, keys)))  # type: ignore[arg-type]
+def apply_set_operation(database: Database, operation: Callable[..., set], keys: list[bytes]) -> set:
+    sets = [database.get_set(key) for key in keys]
+    if operation is set.intersection:
+        sets.sort(key=len)
+    return operation(*sets)
 
 
 @ServerCommandsRouter.command(b"sunion", [b"read", b"set", b"slow"])
@@ -124,10 +129,14 @@ class SetDifference(DatabaseCommand):
 
 
 def apply_set_store_operation(
-    database: Database, operation: Callable[[set, set], set], keys: list[bytes], destination: bytes
+    database: Database, operation: Callable[..., set], keys: list[bytes], destination: bytes
 ) -> int:
-    database.data[destination].value = functools.reduce(operation, map(database.get_set, keys))
-    return len(database.data[destination].value)
+    result = apply_set_operation(database, operation, keys)
+    if result:
+        database.data[destination] = KeyValue(destination, result)
+    else:
+        database.pop(destination)
+    return len(result)
 
 
 @ServerCommandsRouter.command(b"sunionstore", [b"write", b"set", b"slow"])
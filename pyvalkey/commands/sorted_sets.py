@@ -1,46 +1,61 @@
+from collections.abc import Iterator
 from enum import Enum
+from typing import Any
 
+from pyvalkey.commands.core import DatabaseCommand
 from pyvalkey.commands.parameters import (
     keyword_parameter,
     positional_parameter,
 )
 from pyvalkey.commands.router import ServerCommandsRouter
-from pyvalkey.commands.strings_commands import DatabaseCommand
-from pyvalkey.commands.utils import parse_range_parameters
+from pyvalkey.commands.utils import parse_float, parse_range_parameters
 from pyvalkey.database_objects.databases import (
     MAX_BYTES,
     Database,
+    KeyValue,
     RangeLimit,
+    ServerSortedSet,
 )
+from pyvalkey.database_objects.errors import ServerError
 from pyvalkey.resp import ValueType
 
+LEX_SENTINELS: dict[bytes, tuple[bytes, bool]] = {
+    b"-": (b"", True),
+    b"+": (MAX_BYTES, True),
+}
+
+
+def parse_score_parameter(score: bytes) -> tuple[float, bool]:
+    inclusive = score[:1] != b"("
+    if not inclusive:
+        score = score[1:]
+    try:
+        return parse_float(score), inclusive
+    except ValueError:
+        raise ServerError(b"ERR min or max is not a float")
 
-def parse_score_parameter(score: bytes) -> tuple[bytes, bool]:
-    result_score: bytes
-    min_inclusive = True
-    if score == b"-":
-        result_score = b""
-    elif score == b"+":
-        result_score = MAX_BYTES
-    elif score == b"-inf":
-        result_score = score
-    elif score == b"+inf":
-        result_score = score
-    elif b"(" in score:
-        result_score = score[1:]
-        min_inclusive = False
-    elif b"[" in score:
-        result_score = score[1:]
-    else:
-        result_score = score
 
-    return result_score, min_inclusive
+def parse_lex_parameter(lex: bytes) -> tuple[bytes, bool]:
+    sentinel = LEX_SENTINELS.get(lex)
+    if sentinel is not None:
+        return sentinel
 
+    prefix = lex[:1]
+    if prefix == b"(":
+        return lex[1:], False
+    if prefix == b"[":
+        return lex[1:], True
+    return lex, True
 
-def parse_ordered_range_parameters(min_score: bytes, max_score: bytes) -> tuple[bytes, bool, bytes, bool]:
+
+def parse_score_range_parameters(min_score: bytes, max_score: bytes) -> tuple[float, bool, float, bool]:
     return parse_score_parameter(min_score) + parse_score_parameter(max_score)
 
 
+def parse_lex_range_parameters(min_lex: bytes, max_lex: bytes) -> tuple[bytes, bool, bytes, bool]:
+    return parse_lex_parameter(min_lex) + parse_lex_parameter(max_lex)
+
+
 class RangeMode(Enum):
     BY_INDEX = None
     BY_SCORE = b"BYSCORE"
@@ -60,40 +75,60 @@ def sorted_set_range(
 ) -> int | list:
     z = database.get_sorted_set(key)
 
-    if range_mode == RangeMode.BY_SCORE:
-        min_score, min_inclusive, max_score, max_inclusive = parse_ordered_range_parameters(start, stop)
+    if destination:
+        with_scores = True
+
+    if range_mode is RangeMode.BY_SCORE:
+        min_score, min_inclusive, max_score, max_inclusive = parse_score_range_parameters(start, stop)
         result_iterator = z.range_by_score(
-            float(min_score),
-            float(max_score),
+            min_score,
+            max_score,
             min_inclusive,
             max_inclusive,
             with_scores=with_scores,
             is_reversed=is_reversed,
             limit=limit,
         )
-    elif range_mode == RangeMode.BY_LEX:
-        min_score, min_inclusive, max_score, max_inclusive = parse_ordered_range_parameters(start, stop)
+    elif range_mode is RangeMode.BY_LEX:
+        min_lex, min_inclusive, max_lex, max_inclusive = parse_lex_range_parameters(start, stop)
         result_iterator = z.range_by_lexical(
-            min_score,
-            max_score,
+            min_lex,
+            max_lex,
             min_inclusive,
             max_inclusive,
             with_scores=with_scores,
             is_reversed=is_reversed,
             limit=limit,
         )
+    elif start == b"0" and stop == b"-1":
+        result_iterator = z.range(slice(None, None, -1 if is_reversed else None), with_scores=with_scores)
     else:
         result_iterator = z.range(
             parse_range_parameters(int(start), int(stop), is_reversed=is_reversed), with_scores=with_scores
         )
 
     if destination:
-        dz = database.get_or_create_sorted_set(destination)
-        dz.update_with_iterator(result_iterator)
-        return len(dz)
+        members_and_scores: Iterator[Any] = iter(result_iterator)
+        destination_sorted_set = ServerSortedSet(list(zip(members_and_scores, members_and_scores)))
+        if destination_sorted_set:
+            database.data[destination] = KeyValue(destination, destination_sorted_set)
+        else:
+            database.pop(destination)
+        return len(destination_sorted_set)
     return list(result_iterator)
 
 
+def sorted_set_rank(
+    database: Database, key: bytes, member: bytes, with_score: bool = False, is_reversed: bool = False
+) -> ValueType:
+    z = database.get_sorted_set(key)
+
+    rank = z.rank(member, is_reversed=is_reversed)
+    if rank is None or not with_score:
+        return rank
+    return [rank, z.members_scores[member]]
+
+
 class AddMode(Enum):
     ALL = None
     UPDATE_ONLY = b"XX"
@@ -117,14 +152,14 @@ class SortedSetAdd(DatabaseCommand):
     )
     return_changed_elements: bool = keyword_parameter(flag=b"CH")
     increment_mode: bool = keyword_parameter(flag=b"INCR")
-    scores_members: list[tuple[int, bytes]] = positional_parameter()
+    scores_members: list[tuple[float, bytes]] = positional_parameter()
 
     def execute(self) -> ValueType:
         z = self.database.get_or_create_sorted_set(self.key)
-        length_before = len(z)
-        for score, member in self.scores_members:
-            z.add(score, member)
-        return len(z) - length_before
+        added, updated = z.add_many(self.scores_members)
+        if self.return_changed_elements:
+            return added + updated
+        return added
 
 
 @ServerCommandsRouter.command(b"zrange", [b"read", b"sortedset", b"slow"])
@@ -193,6 +228,7 @@ class SortedSetReversedRange(DatabaseCommand):
             start=self.start,
             stop=self.stop,
             with_scores=self.with_scores,
+            is_reversed=True,
         )
 
 
@@ -228,8 +264,8 @@ class SortedSetReversedRangeByScore(DatabaseCommand):
         return sorted_set_range(
             database=self.database,
             key=self.key,
-            start=self.min,
-            stop=self.max,
+            start=self.max,
+            stop=self.min,
             with_scores=self.with_scores,
             limit=self.limit,
             is_reversed=True,
@@ -266,8 +302,8 @@ class SortedSetReversedRangeByLexical(DatabaseCommand):
         return sorted_set_range(
             database=self.database,
             key=self.key,
-            start=self.min,
-            stop=self.max,
+            start=self.max,
+            stop=self.min,
             limit=self.limit,
             is_reversed=True,
             range_mode=RangeMode.BY_LEX,
@@ -281,16 +317,31 @@ class SortedSetCount(DatabaseCommand):
     max: bytes = positional_parameter()
 
     def execute(self) -> ValueType:
-        min_score, min_inclusive, max_score, max_inclusive = parse_ordered_range_parameters(self.min, self.max)
+        min_score, min_inclusive, max_score, max_inclusive = parse_score_range_parameters(self.min, self.max)
 
-        z = self.database.get_or_create_sorted_set(self.key)
+        z = self.database.get_sorted_set(self.key)
 
-        return sum(
-            1
-            for _ in z.range_by_score(
-                float(min_score), float(max_score), min_inclusive, max_inclusive, with_scores=False
-            )
-        )
+        return z.count_by_score(min_score, max_score, min_inclusive, max_inclusive)
+
+
+@ServerCommandsRouter.command(b"zrank", [b"read", b"sortedset", b"fast"])
+class SortedSetRank(DatabaseCommand):
+    key: bytes = positional_parameter()
+    member: bytes = positional_parameter()
+    with_score: bool = keyword_parameter(flag=b"WITHSCORE")
+
+    def execute(self) -> ValueType:
+        return sorted_set_rank(self.database, self.key, self.member, self.with_score)
+
+
+@ServerCommandsRouter.command(b"zrevrank", [b"read", b"sortedset", b"fast"])
+class SortedSetReversedRank(DatabaseCommand):
+    key: bytes = positional_parameter()
+    member: bytes = positional_parameter()
+    with_score: bool = keyword_parameter(flag=b"WITHSCORE")
+
+    def execute(self) -> ValueType:
+        return sorted_set_rank(self.database, self.key, self.member, self.with_score, is_reversed=True)
 
 
 @ServerCommandsRouter.command(b"zcard", [b"read", b"sortedset", b"fast"])
@@ -298,4 +349,4 @@ class SortedSetCardinality(DatabaseCommand):
     key: bytes = positional_parameter()
 
     def execute(self) -> ValueType:
-        return len(self.database.get_or_create_sorted_set(self.key).members)
+        return len(self.database.get_sorted_set(self.key))
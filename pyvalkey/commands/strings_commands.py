@@ -1,4 +1,3 @@
-import fnmatch
 import operator
 from enum import Enum
 from functools import reduce
@@ -9,6 +8,7 @@ from pyvalkey.commands.parameters import keyword_parameter, positional_parameter
 from pyvalkey.commands.router import ServerCommandsRouter
 from pyvalkey.database_objects.databases import Database, StringType
 from pyvalkey.database_objects.errors import ServerError, ServerWrongTypeError, ValkeySyntaxError
+from pyvalkey.database_objects.utils import compile_glob, is_glob
 from pyvalkey.resp import RESP_OK, ValueType
 
 
@@ -273,7 +273,10 @@ class Keys(DatabaseCommand):
     pattern: bytes = positional_parameter()
 
     def execute(self) -> ValueType:
-        return list(fnmatch.filter(self.database.data.keys(), self.pattern))
+        if not is_glob(self.pattern):
+            return [self.pattern] if self.pattern in self.database.data else []
+        match = compile_glob(self.pattern).match
+        return [key for key in self.database.data if match(key)]
 
 
 @ServerCommandsRouter.command(b"dbsize", [b"keyspace", b"read", b"fast"])
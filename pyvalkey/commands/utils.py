@@ -1,3 +1,6 @@
+import math
+
+
 def parse_range_parameters(start: int, stop: int, is_reversed: bool = False) -> slice:
     if not is_reversed:
         python_start = start
@@ -13,3 +16,12 @@ def parse_range_parameters(start: int, stop: int, is_reversed: bool = False) ->
     else:
         python_reversed_stop = -(stop + 2)
     return slice(python_reversed_start, python_reversed_stop, -1)
+
+
+def parse_float(value: bytes) -> float:
+    if b"_" in value or value[:1].isspace() or value[-1:].isspace():
+        raise ValueError(value)
+    result = float(value)
+    if math.isnan(result):
+        raise ValueError(value)
+    return result
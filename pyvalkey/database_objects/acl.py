@@ -1,22 +1,15 @@
 from __future__ import annotations
 
-import fnmatch
-from collections import defaultdict
-from dataclasses import dataclass, field, fields
-from hashlib import sha256
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, ClassVar, Self
 
-from pyvalkey.commands.parameters import ParameterMetadata
 from pyvalkey.database_objects.errors import CommandPermissionError, KeyPermissionError, NoPermissionError
+from pyvalkey.database_objects.utils import compile_glob, hash_password
 
 if TYPE_CHECKING:
     from pyvalkey.commands.core import Command
 
 
-def check_command_by_category(command_name: bytes, category: bytes) -> bool:
-    return category in ACL.COMMAND_CATEGORIES[command_name]
-
-
 @dataclass(unsafe_hash=True)
 class KeyPattern:
     pattern: bytes
@@ -25,7 +18,7 @@ class KeyPattern:
     def check(self, key: bytes, key_mode: bytes) -> bool:
         if self.mode and self.mode != key_mode:
             return False
-        return fnmatch.fnmatch(key, self.pattern)
+        return compile_glob(self.pattern).match(key) is not None
 
     @classmethod
     def create(cls, rule: bytes) -> Self:
@@ -44,12 +37,12 @@ class CommandRule:
     allowed: bool
     is_category: bool
 
-    def check(self, command_name: bytes) -> bool:
+    def check(self, command_name: bytes, command_categories: frozenset[bytes]) -> bool:
         if self.is_category:
             if self.allowed:
-                return self.rule == b"all" or check_command_by_category(command_name, self.rule)
+                return self.rule == b"all" or self.rule in command_categories
             else:
-                return self.rule != b"all" and check_command_by_category(command_name, self.rule)
+                return self.rule != b"all" and self.rule in command_categories
         if command_name == self.rule:
             return self.allowed
         return not self.allowed
@@ -78,19 +71,14 @@ class Permission:
         command_name = ACL.COMMANDS_NAMES[command.__class__]
 
         is_fields_allowed = {}
-        for command_field in fields(command):
-            key_mode = command_field.metadata.get(ParameterMetadata.KEY_MODE, None)
-            if not key_mode:
-                continue
-
-            is_fields_allowed[command_field.name] = False
-            if self.check_keys_patterns(getattr(command, command_field.name), key_mode):
-                is_fields_allowed[command_field.name] = True
+        for field_name, key_mode in ACL.COMMANDS_KEY_FIELDS[command.__class__]:
+            is_fields_allowed[field_name] = self.check_keys_patterns(getattr(command, field_name), key_mode)
         key_allowed = not self.keys_patterns or not is_fields_allowed or any(is_fields_allowed.values())
 
+        command_categories = ACL.COMMAND_CATEGORIES[command_name]
         results = []
         for command_rule in self.command_rules:
-            results.append(command_rule.check(command_name))
+            results.append(command_rule.check(command_name, command_categories))
         command_allowed = (results[0] and all(results)) or (not results[0] and any(results))
 
         if not command_allowed:
@@ -117,7 +105,7 @@ class ACLUser:
     selectors: list[Permission] = field(default_factory=list)
 
     def add_password(self, password: bytes) -> None:
-        self.passwords.add(sha256(password).hexdigest().encode())
+        self.passwords.add(hash_password(password))
 
     @property
     def info(self) -> dict[bytes, list | bytes]:
@@ -163,9 +151,10 @@ class ACLUser:
 
 
 class ACL(dict[bytes, ACLUser]):
-    CATEGORIES: ClassVar[dict[bytes, set[bytes]]] = defaultdict(set)
+    CATEGORIES: ClassVar[dict[bytes, set[bytes]]] = {}
     COMMANDS_NAMES: ClassVar[dict[type[Command], bytes]] = {}
-    COMMAND_CATEGORIES: ClassVar[dict[bytes, set]] = {}
+    COMMANDS_KEY_FIELDS: ClassVar[dict[type[Command], tuple[tuple[str, bytes], ...]]] = {}
+    COMMAND_CATEGORIES: ClassVar[dict[bytes, frozenset[bytes]]] = {}
 
     def get_or_create_user(self, user_name: bytes) -> ACLUser:
         if user_name not in self:
@@ -189,7 +178,7 @@ class ACL(dict[bytes, ACLUser]):
 
     @classmethod
     def get_category_commands(cls, category: bytes) -> list[bytes]:
-        return list(cls.CATEGORIES.get(category, set()))
+        return list(cls.CATEGORIES.get(category, ()))
 
     @classmethod
     def create(cls) -> ACL:
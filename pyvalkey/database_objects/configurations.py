@@ -1,9 +1,8 @@
 import fnmatch
 from dataclasses import Field, dataclass, field, fields
-from hashlib import sha256
 from typing import Any, Literal
 
-from pyvalkey.database_objects.utils import to_bytes
+from pyvalkey.database_objects.utils import hash_password, to_bytes
 
 
 def configuration(
@@ -53,7 +52,7 @@ class Configurations:
 
         if field_type == "password":
             (value,) = values
-            setattr(self, name.decode(), sha256(value).hexdigest().encode())
+            setattr(self, name.decode(), hash_password(value))
         elif field_type == "integer":
             (value,) = values
             setattr(self, name.decode(), int(value.decode()))
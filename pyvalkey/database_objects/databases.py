@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import functools
-import itertools
 import operator
 import time
 from collections.abc import Iterable
@@ -12,7 +11,6 @@ from sortedcontainers import SortedDict, SortedSet
 
 from pyvalkey.commands.parameters import positional_parameter
 from pyvalkey.database_objects.errors import ServerError, ServerWrongTypeError
-from pyvalkey.database_objects.utils import flatten
 
 
 @functools.total_ordering
@@ -137,6 +135,8 @@ class RangeLimit:
 
 
 class ServerSortedSet:
+    __slots__ = ("members", "members_scores")
+
     def __init__(self, members_and_scores: Iterable[tuple[bytes, float]] | None = None) -> None:
         members_and_scores = members_and_scores or []
         self.members = SortedSet({(score, member) for member, score in members_and_scores})
@@ -146,15 +146,6 @@ class ServerSortedSet:
         for score, member in scored_members:
             self.add(score, member)
 
-    def update_with_iterator(self, iterator: Iterable[bytes | float]) -> None:
-        member = None
-        for item in iterator:
-            if member is None:
-                member = item
-            else:
-                self.add(item, member)
-                member = None
-
     def add(self, score: float, member: bytes) -> None:
         if member in self.members_scores:
             old_score = self.members_scores[member]
@@ -162,6 +153,26 @@ class ServerSortedSet:
         self.members_scores[member] = score
         self.members.add((score, member))
 
+    def add_many(self, scored_members: Iterable[tuple[float, bytes]]) -> tuple[int, int]:
+        members = self.members
+        members_scores = self.members_scores
+
+        added_members: set[bytes] = set()
+        updated = 0
+        for score, member in scored_members:
+            old_score = members_scores.get(member)
+            if old_score is None:
+                added_members.add(member)
+            elif old_score == score:
+                continue
+            else:
+                members.remove((old_score, member))
+                if member not in added_members:
+                    updated += 1
+            members_scores[member] = score
+            members.add((score, member))
+        return len(added_members), updated
+
     def range_by_score(
         self,
         min_score: float,
@@ -172,29 +183,70 @@ class ServerSortedSet:
         is_reversed: bool = False,
         limit: RangeLimit | None = None,
     ) -> Iterable[bytes | float]:
-        if not is_reversed:
-            minimum = (min_score, (b"" if min_inclusive else MAX_BYTES))
-            maximum = (max_score, (MAX_BYTES if max_inclusive else b""))
-        else:
+        if is_reversed:
+            min_score, max_score = max_score, min_score
             min_inclusive, max_inclusive = max_inclusive, min_inclusive
-            minimum = (max_score, (b"" if max_inclusive else MAX_BYTES))
-            maximum = (min_score, (MAX_BYTES if min_inclusive else b""))
 
-        iterator = self.members.irange(minimum, maximum, (min_inclusive, max_inclusive), reverse=is_reversed)
+        members = self.members
+        if not members or max_score < members[0][0] or min_score > members[-1][0]:
+            return
 
-        if limit:
-            offset = limit.offset
-            count = limit.count + limit.offset
-        else:
-            offset = None
-            count = None
-        for score, member in itertools.islice(iterator, offset, count):
+        first_index, last_index = self._score_indexes(min_score, max_score, min_inclusive, max_inclusive)
+        first_index, last_index = self._limit_indexes(first_index, last_index, is_reversed, limit)
+        if first_index >= last_index:
+            return
+
+        for score, member in members.islice(first_index, last_index, reverse=is_reversed):
             if with_scores:
                 yield member
                 yield score
             else:
                 yield member
 
+    def _score_indexes(
+        self, min_score: float, max_score: float, min_inclusive: bool, max_inclusive: bool
+    ) -> tuple[int, int]:
+        if min_inclusive:
+            first_index = self.members.bisect_left((min_score, b""))
+        else:
+            first_index = self.members.bisect_right((min_score, MAX_BYTES))
+        if max_inclusive:
+            last_index = self.members.bisect_right((max_score, MAX_BYTES))
+        else:
+            last_index = self.members.bisect_left((max_score, b""))
+        return first_index, last_index
+
+    @staticmethod
+    def _limit_indexes(
+        first_index: int, last_index: int, is_reversed: bool, limit: RangeLimit | None
+    ) -> tuple[int, int]:
+        if limit is None:
+            return first_index, last_index
+        if limit.offset < 0:
+            return first_index, first_index
+        if is_reversed:
+            last_index -= limit.offset
+            if limit.count >= 0:
+                first_index = max(first_index, last_index - limit.count)
+        else:
+            first_index += limit.offset
+            if limit.count >= 0:
+                last_index = min(last_index, first_index + limit.count)
+        return first_index, last_index
+
+    def count_by_score(self, min_score: float, max_score: float, min_inclusive: bool, max_inclusive: bool) -> int:
+        first_index, last_index = self._score_indexes(min_score, max_score, min_inclusive, max_inclusive)
+        return max(last_index - first_index, 0)
+
+    def rank(self, member: bytes, is_reversed: bool = False) -> int | None:
+        score = self.members_scores.get(member)
+        if score is None:
+            return None
+        index = self.members.index((score, member))
+        if is_reversed:
+            return len(self.members) - index - 1
+        return index
+
     def range_by_lexical(
         self,
         min_lex: bytes,
@@ -211,15 +263,23 @@ class ServerSortedSet:
             minimum, maximum = max_lex, min_lex
             min_inclusive, max_inclusive = max_inclusive, min_inclusive
 
-        iterator = self.members_scores.irange(minimum, maximum, (min_inclusive, max_inclusive), reverse=is_reversed)
+        members_scores = self.members_scores
+        if not members_scores or maximum < members_scores.peekitem(0)[0] or minimum > members_scores.peekitem(-1)[0]:
+            return
 
-        if limit:
-            offset = limit.offset
-            count = limit.count + limit.offset
+        if min_inclusive:
+            first_index = members_scores.bisect_left(minimum)
+        else:
+            first_index = members_scores.bisect_right(minimum)
+        if max_inclusive:
+            last_index = members_scores.bisect_right(maximum)
         else:
-            offset = None
-            count = None
-        for member in itertools.islice(iterator, offset, count):
+            last_index = members_scores.bisect_left(maximum)
+        first_index, last_index = self._limit_indexes(first_index, last_index, is_reversed, limit)
+        if first_index >= last_index:
+            return
+
+        for member in members_scores.islice(first_index, last_index, reverse=is_reversed):
             if with_scores:
                 yield member
                 yield self.members_scores[member]
@@ -229,11 +289,14 @@ class ServerSortedSet:
     def range(self, range_slice: slice, with_scores: bool = False) -> list[bytes | float]:
         result = self.members[range_slice]
 
-        offset = None
-        count = None
-        if with_scores:
-            return list(itertools.islice(flatten(result, reverse_sub_lists=True), offset, count))
-        return list(itertools.islice((member for score, member in result), offset, count))
+        if not with_scores:
+            return [member for score, member in result]
+
+        members_and_scores: list[bytes | float] = []
+        for score, member in result:
+            members_and_scores.append(member)
+            members_and_scores.append(score)
+        return members_and_scores
 
     def __len__(self) -> int:
         return len(self.members)
@@ -18,10 +18,6 @@ class CommandPermissionError(NoPermissionError):
         self.command_name = command_name
 
 
-class RouterKeyError(ServerError):
-    pass
-
-
 class ServerWrongTypeError(ServerError):
     pass
 
@@ -1,10 +1,25 @@
 from dataclasses import dataclass
+from typing import ClassVar
 
-from pyvalkey.database_objects.utils import to_bytes
 
-
-@dataclass
+@dataclass(slots=True)
 class Information:
+    TEMPLATE: ClassVar[bytes] = b"\r\n".join(
+        [
+            b"# Server",
+            b"redis_version:%b",
+            b"arch_bits:%b",
+            b"",
+            b"# Cluster",
+            b"cluster_enabled:%d",
+            b"",
+            b"# Stats",
+            b"total_commands_processed:%d",
+            b"",
+            b"enterprise:%d",
+        ]
+    )
+
     server_version: bytes = b"7.0.0"
     arch_bits: bytes = b"64"
     cluster_enabled: bool = False
@@ -12,18 +27,10 @@ class Information:
     total_commands_processed: int = 0
 
     def all(self) -> bytes:
-        return b"\r\n".join(
-            [
-                b"# Server",
-                b"redis_version:" + self.server_version,
-                b"arch_bits:" + self.arch_bits,
-                b"",
-                b"# Cluster",
-                b"cluster_enabled:" + (b"1" if self.cluster_enabled else b"0"),
-                b"",
-                b"# Stats",
-                b"total_commands_processed:" + to_bytes(self.total_commands_processed),
-                b"",
-                b"enterprise:" + (b"1" if self.enterprise else b"0"),
-            ]
+        return self.TEMPLATE % (
+            self.server_version,
+            self.arch_bits,
+            self.cluster_enabled,
+            self.total_commands_processed,
+            self.enterprise,
         )
@@ -1,5 +1,7 @@
-from collections.abc import Iterable, Sequence
-from typing import TypeVar
+import fnmatch
+import functools
+import re
+from hashlib import sha256
 
 
 def to_bytes(value: bytes | int | str) -> bytes:
@@ -8,9 +10,17 @@ def to_bytes(value: bytes | int | str) -> bytes:
     return str(value).encode()
 
 
-T = TypeVar("T")
+def hash_password(password: bytes) -> bytes:
+    return sha256(password).hexdigest().encode()
 
 
-def flatten(value: Iterable[Sequence[T]], reverse_sub_lists: bool = False) -> Iterable[T]:
-    for item in value:
-        yield from (item if not reverse_sub_lists else reversed(item))
+GLOB_SPECIAL_CHARACTERS = re.compile(rb"[*?\[\\]")
+
+
+@functools.lru_cache(maxsize=256)
+def compile_glob(pattern: bytes) -> re.Pattern[bytes]:
+    return re.compile(fnmatch.translate(pattern.decode("latin-1")).encode("latin-1"))
+
+
+def is_glob(pattern: bytes) -> bool:
+    return GLOB_SPECIAL_CHARACTERS.search(pattern) is not None
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from typing import AnyStr, BinaryIO
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, AnyStr, BinaryIO, ClassVar
 
 
 class RespSimpleString(bytes):
@@ -27,24 +28,39 @@ class RespLoader:
             array[i] = self.load()
         return array
 
+    def load_array_header(self, length: bytes) -> list[LoadedType]:
+        return self.load_array(int(length))
+
+    def load_bulk_string(self, length: bytes) -> bytes:
+        bulk_string_length = int(length)
+        bulk_string = self.reader.read(bulk_string_length + 2)[:-2]
+        if len(bulk_string) != bulk_string_length:
+            raise ValueError()
+        return bulk_string
+
+    def load_integer(self, value: bytes) -> int:
+        return int(value)
+
+    def load_simple_string(self, value: bytes) -> RespSimpleString:
+        return RespSimpleString(value)
+
+    def load_error(self, value: bytes) -> RespError:
+        return RespError(value)
+
+    LOADERS: ClassVar[dict[bytes, Callable[["RespLoader", bytes], LoadedType]]] = {
+        b"*": load_array_header,
+        b"$": load_bulk_string,
+        b":": load_integer,
+        b"+": load_simple_string,
+        b"-": load_error,
+    }
+
     def load(self) -> LoadedType:
         line = self.reader.readline().strip(b"\r\n")
-        match line[0:1], line[1:]:
-            case b"*", length:
-                return self.load_array(int(length))
-            case b"$", length:
-                bulk_string = self.reader.read(int(length) + 2)[:-2]
-                if len(bulk_string) != int(length):
-                    raise ValueError()
-                return bulk_string
-            case b":", value:
-                return int(value)
-            case b"+", value:
-                return RespSimpleString(value)
-            case b"-", value:
-                return RespError(value)
-            case _:
-                return None
+        loader = self.LOADERS.get(line[0:1])
+        if loader is None:
+            return None
+        return loader(self, line[1:])
 
     def load_dynamic_array(self) -> list:
         line = self.reader.readline().strip(b"\r\n")
@@ -57,57 +73,78 @@ def load(stream: BinaryIO) -> list:
 
 @dataclass
 class RespDumper:
-    writer: BinaryIO
+    buffer: bytearray = field(default_factory=bytearray)
 
     def dump_bulk_string(self, value: AnyStr) -> None:
         if isinstance(value, str):
             bytes_value = value.encode()
         else:
             bytes_value = value
-        self.writer.write(b"$" + str(len(bytes_value)).encode() + b"\r\n" + bytes_value + b"\r\n")
+        self.buffer += b"$%d\r\n%b\r\n" % (len(bytes_value), bytes_value)
 
     def dump_string(self, value: AnyStr) -> None:
         if isinstance(value, str):
             bytes_value = value.encode()
         else:
             bytes_value = value
-        self.writer.write(b"+" + bytes_value + b"\r\n")
+        self.buffer += b"+%b\r\n" % bytes_value
 
-    def dump_array(self, value: list) -> None:
-        self.writer.write(f"*{len(value)}\r\n".encode())
+    def dump_array(self, value: list | set) -> None:
+        self.buffer += b"*%d\r\n" % len(value)
         for item in value:
             self.dump(item)
 
+    def dump_dict(self, value: dict) -> None:
+        self.buffer += b"*%d\r\n" % (len(value) * 2)
+        for k, v in value.items():
+            self.dump(k)
+            self.dump(v)
+
+    def dump_bool(self, value: bool) -> None:
+        self.dump_integer(1 if value else 0)
+
+    def dump_integer(self, value: int) -> None:
+        self.buffer += b":%d\r\n" % value
+
+    def dump_float(self, value: float) -> None:
+        self.dump_bulk_string(b"%g" % value)
+
+    def dump_error(self, value: RespError) -> None:
+        self.buffer += b"-%b\r\n" % value
+
+    def dump_none(self, value: None) -> None:
+        self.buffer += b"$-1\r\n"
+
+    DUMPERS: ClassVar[dict[type, Callable[["RespDumper", Any], None]]] = {
+        bool: dump_bool,
+        int: dump_integer,
+        float: dump_float,
+        RespSimpleString: dump_string,
+        RespError: dump_error,
+        str: dump_bulk_string,
+        bytes: dump_bulk_string,
+        list: dump_array,
+        set: dump_array,
+        dict: dump_dict,
+        type(None): dump_none,
+    }
+
     def dump(self, value: ValueType) -> None:
-        if isinstance(value, bool):
-            if value:
-                self.dump(1)
+        dumper = self.DUMPERS.get(type(value))
+        if dumper is None:
+            for value_type, dumper in self.DUMPERS.items():
+                if isinstance(value, value_type):
+                    break
             else:
-                self.dump(0)
-        elif isinstance(value, int):
-            self.writer.write(f":{value}\r\n".encode())
-        elif isinstance(value, float):
-            self.dump_bulk_string(f"{value:g}")
-        elif isinstance(value, RespSimpleString):
-            self.dump_string(value)
-        elif isinstance(value, RespError):
-            self.writer.write(f"-{value.decode()}\r\n".encode())
-        elif isinstance(value, str | bytes):
-            if isinstance(value, str):
-                value = value.encode()
-            self.dump_bulk_string(value)
-        elif isinstance(value, list):
-            self.dump_array(value)
-        elif isinstance(value, set):
-            self.dump_array(list(value))
-        elif isinstance(value, dict):
-            result = []
-            for k, v in value.items():
-                result += [k, v]
-            self.dump_array(result)
-        elif value is None:
-            self.writer.write(b"$-1\r\n")
+                return
+        dumper(self, value)
+
+
+def dumps(value: ValueType) -> bytes:
+    dumper = RespDumper()
+    dumper.dump(value)
+    return bytes(dumper.buffer)
 
 
 def dump(value: ValueType, stream: BinaryIO) -> None:
-    RespDumper(stream).dump(value)
+    stream.write(dumps(value))
@@ -3,7 +3,6 @@ import logging
 import select
 import time
 from collections import defaultdict
-from io import BytesIO
 from socket import socket
 from socketserver import StreamRequestHandler, ThreadingTCPServer
 
@@ -15,7 +14,6 @@ from pyvalkey.database_objects.configurations import Configurations
 from pyvalkey.database_objects.databases import Database
 from pyvalkey.database_objects.errors import (
     CommandPermissionError,
-    RouterKeyError,
     ServerError,
     ServerInvalidIntegerError,
     ServerWrongNumberOfArgumentsError,
@@ -23,7 +21,7 @@ from pyvalkey.database_objects.errors import (
     ValkeySyntaxError,
 )
 from pyvalkey.database_objects.information import Information
-from pyvalkey.resp import RESP_OK, RespError, ValueType, dump, load
+from pyvalkey.resp import RESP_OK, RespError, ValueType, dumps, load
 
 logger = logging.getLogger(__name__)
 
@@ -73,12 +71,9 @@ class ServerConnectionHandler(StreamRequestHandler):
             current_client=self.current_client,
         )
 
-        self.router = ServerCommandsRouter()
-
     def dump(self, value: ValueType) -> None:
-        dumped = BytesIO()
-        dump(value, dumped)
-        print(self.current_client.client_id, "result", dumped.getvalue()[:100])
+        dumped = dumps(value)
+        print(self.current_client.client_id, "result", dumped[:100])
 
         if self.current_client.reply_mode == "skip":
             self.current_client.reply_mode = "on"
@@ -87,7 +82,7 @@ class ServerConnectionHandler(StreamRequestHandler):
         if self.current_client.reply_mode == "off":
             return
 
-        dump(value, self.wfile)
+        self.wfile.write(dumped)
 
     def handle(self) -> None:
         while not self.current_client.is_killed:
@@ -107,7 +102,15 @@ class ServerConnectionHandler(StreamRequestHandler):
             print(self.current_client.client_id, [i[:100] for i in command])
 
             try:
-                routed_command = self.router.route(list(command), self.client_context)
+                routed_command = self.server.router.route(command, self.client_context)
+                if routed_command is None:
+                    self.dump(
+                        RespError(
+                            f"ERR unknown command '{command[0]}', "
+                            f"with args beginning with: {command[1] if len(command) > 1 else ''}".encode()
+                        )
+                    )
+                    continue
 
                 if self.client_context.current_user:
                     self.client_context.current_user.check_permissions(routed_command)
@@ -117,13 +120,6 @@ class ServerConnectionHandler(StreamRequestHandler):
                     while self.server_context.is_paused and time.time() < self.server_context.pause_timeout:
                         time.sleep(0.1)
                     self.server_context.pause_timeout = 0
-            except RouterKeyError:
-                self.dump(
-                    RespError(
-                        f"ERR unknown command '{command[0]}', "
-                        f"with args beginning with: {command[1] if len(command) > 1 else ''}".encode()
-                    )
-                )
             except ServerWrongNumberOfArgumentsError:
                 self.dump(RespError(b"ERR wrong number of arguments for '" + command[0] + b"' command"))
             except ServerWrongTypeError:
@@ -166,3 +162,4 @@ class ValkeyServer(ThreadingTCPServer):
         self.clients: ClientList = ClientList()
         self.configurations: Configurations = Configurations()
         self.information: Information = Information()
+        self.router: ServerCommandsRouter = ServerCommandsRouter()
@@ -3,13 +3,14 @@ from typing import Any
 import pytest
 from parametrization import Parametrization
 
-from pyvalkey.commands.clients import ClientKill
+from pyvalkey.commands.clients import ClientKill, ClientReply, ReplyMode
 from pyvalkey.commands.core import Command
 from pyvalkey.commands.keyspace_commands import Copy
 from pyvalkey.commands.parameters import positional_parameter
 from pyvalkey.commands.parsers import server_command
-from pyvalkey.commands.sorted_sets import AddMode, RangeMode, SortedSetAdd, SortedSetRange
-from pyvalkey.commands.strings_commands import Ping
+from pyvalkey.commands.sorted_sets import AddMode, RangeMode, ScoreUpdateMode, SortedSetAdd, SortedSetRange
+from pyvalkey.commands.strings_commands import BitCount, Ping
+from pyvalkey.database_objects.databases import RangeLimit
 from pyvalkey.database_objects.errors import ServerWrongNumberOfArgumentsError, ValkeySyntaxError
 
 
@@ -75,6 +76,83 @@ class ListCommand(Command):
     command_cls=SortedSetAdd,
     expected_kwargs={"key": b"myzset", "scores_members": [(2, b"two"), (3, b"three")], "add_mode": AddMode.INSERT_ONLY},
 )
+@Parametrization.case(
+    name="zadd_mixed_case_keyword_before_numeric_scores",
+    parameters=b"myzset Nx 2 Two 3.5 three".split(),
+    command_cls=SortedSetAdd,
+    expected_kwargs={
+        "key": b"myzset",
+        "scores_members": [(2, b"Two"), (3.5, b"three")],
+        "add_mode": AddMode.INSERT_ONLY,
+    },
+)
+@Parametrization.case(
+    name="zadd_lower_case_keywords",
+    parameters=b"myzset nx ch 2 two".split(),
+    command_cls=SortedSetAdd,
+    expected_kwargs={
+        "key": b"myzset",
+        "scores_members": [(2, b"two")],
+        "add_mode": AddMode.INSERT_ONLY,
+        "return_changed_elements": True,
+    },
+)
+@Parametrization.case(
+    name="zadd_mixed_case_keywords",
+    parameters=b"myzset Xx Gt Ch 2 two".split(),
+    command_cls=SortedSetAdd,
+    expected_kwargs={
+        "key": b"myzset",
+        "scores_members": [(2, b"two")],
+        "add_mode": AddMode.UPDATE_ONLY,
+        "score_update": ScoreUpdateMode.GREATER_THAN,
+        "return_changed_elements": True,
+    },
+)
+@Parametrization.case(
+    name="zrange_lower_case_enum_keyword",
+    parameters=b"zset [a [c bylex".split(),
+    command_cls=SortedSetRange,
+    expected_kwargs={"key": b"zset", "start": b"[a", "stop": b"[c", "range_mode": RangeMode.BY_LEX},
+)
+@Parametrization.case(
+    name="zrange_mixed_case_keywords",
+    parameters=b"zset 1 5 ByScore Rev WithScores limit 0 2".split(),
+    command_cls=SortedSetRange,
+    expected_kwargs={
+        "key": b"zset",
+        "start": b"1",
+        "stop": b"5",
+        "range_mode": RangeMode.BY_SCORE,
+        "rev": True,
+        "limit": RangeLimit(offset=0, count=2),
+        "with_scores": True,
+    },
+)
+@Parametrization.case(
+    name="client_reply_lower_case_enum",
+    parameters=[b"off"],
+    command_cls=ClientReply,
+    expected_kwargs={"mode": ReplyMode.OFF},
+)
+@Parametrization.case(
+    name="client_reply_mixed_case_enum",
+    parameters=[b"Skip"],
+    command_cls=ClientReply,
+    expected_kwargs={"mode": ReplyMode.SKIP},
+)
+@Parametrization.case(
+    name="bitcount_lower_case_bool_value",
+    parameters=b"key 0 1 bit".split(),
+    command_cls=BitCount,
+    expected_kwargs={"key": b"key", "count_range": (0, 1), "bit_mode": True},
+)
+@Parametrization.case(
+    name="bitcount_mixed_case_bool_value",
+    parameters=b"key 0 1 Byte".split(),
+    command_cls=BitCount,
+    expected_kwargs={"key": b"key", "count_range": (0, 1), "bit_mode": False},
+)
 @Parametrization.case(
     name="",
     parameters=b"a b".split(),
@@ -117,6 +195,18 @@ def test_parser__successful(parameters, command_cls: Command, expected_kwargs: d
     expected_exception=ValkeySyntaxError,
     command_cls=SortedSetAdd,
 )
+@Parametrization.case(
+    name="client_reply_unknown_enum",
+    parameters=[b"Offf"],
+    expected_exception=ValkeySyntaxError,
+    command_cls=ClientReply,
+)
+@Parametrization.case(
+    name="bitcount_unknown_bool_value",
+    parameters=b"key 0 1 bits".split(),
+    expected_exception=ValkeySyntaxError,
+    command_cls=BitCount,
+)
 def test_parser__failure(parameters, expected_exception, command_cls: Command):
     with pytest.raises(expected_exception):
         command_cls.parse(parameters)
@@ -0,0 +1,31 @@
+import pytest
+
+from pyvalkey.commands.configs import ConfigGet
+from pyvalkey.commands.parsers import ParametersCursor
+from pyvalkey.commands.router import ServerCommandsRouter
+from pyvalkey.commands.sorted_sets import SortedSetAdd
+
+
+class TestServerCommandsRouter:
+    @pytest.mark.parametrize("command_name", [b"zadd", b"ZADD", b"ZaDd", b"zADD"])
+    def test_internal_route_command_case(self, command_name):
+        parameters = ParametersCursor([command_name, b"z", b"1", b"a"])
+
+        assert ServerCommandsRouter().internal_route(parameters, ServerCommandsRouter.ROUTES) is SortedSetAdd
+        assert parameters.next() == b"z"
+
+    @pytest.mark.parametrize(
+        "command_parameters",
+        [[b"config", b"get"], [b"CONFIG", b"GET"], [b"config", b"GeT"], [b"CoNfIg", b"get"], [b"Config", b"Get"]],
+    )
+    def test_internal_route_subcommand_case(self, command_parameters):
+        parameters = ParametersCursor([*command_parameters, b"maxmemory"])
+
+        assert ServerCommandsRouter().internal_route(parameters, ServerCommandsRouter.ROUTES) is ConfigGet
+        assert parameters.next() == b"maxmemory"
+
+    @pytest.mark.parametrize("command_parameters", [[b"zaddd"], [b"1"], [b"config", b"GeTT"], [b"config"]])
+    def test_internal_route_unknown_command(self, command_parameters):
+        parameters = ParametersCursor(command_parameters)
+
+        assert ServerCommandsRouter().internal_route(parameters, ServerCommandsRouter.ROUTES) is None
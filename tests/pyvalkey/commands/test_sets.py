@@ -0,0 +1,105 @@
+import pytest
+
+from pyvalkey.commands.sets import (
+    SetAreMembers,
+    SetDifferenceStore,
+    SetIntersectionStore,
+    SetPop,
+    SetRemove,
+    SetUnionStore,
+)
+from pyvalkey.database_objects.databases import Database, KeyValue
+from pyvalkey.database_objects.errors import ServerError
+
+
+@pytest.fixture
+def database():
+    database = Database()
+    database.data[b"a"] = KeyValue(b"a", {b"1", b"2", b"3"})
+    database.data[b"b"] = KeyValue(b"b", {b"2", b"3", b"4"})
+    database.data[b"c"] = KeyValue(b"c", {b"5"})
+    return database
+
+
+class TestSetAreMembers:
+    def test_parse(self):
+        assert SetAreMembers.parse([b"a", b"1", b"9"]) == {"key": b"a", "members": [b"1", b"9"]}
+
+    def test_execute(self, database):
+        command = SetAreMembers(database=database, key=b"a", members=[b"1", b"9", b"3"])
+
+        assert command.execute() == [True, False, True]
+
+
+class TestSetRemove:
+    def test_execute(self, database):
+        command = SetRemove(database=database, key=b"a", members={b"1", b"9"})
+
+        assert command.execute() == 1
+        assert database.get_set(b"a") == {b"2", b"3"}
+
+
+class TestSetPop:
+    def test_execute_with_count(self, database):
+        command = SetPop(database=database, key=b"a", count=2)
+
+        popped = command.execute()
+
+        assert len(popped) == 2
+        assert database.get_set(b"a") == {b"1", b"2", b"3"} - set(popped)
+
+    def test_execute_count_larger_than_set(self, database):
+        command = SetPop(database=database, key=b"a", count=10)
+
+        assert sorted(command.execute()) == [b"1", b"2", b"3"]
+        assert database.get_set(b"a") == set()
+
+    def test_execute_negative_count(self, database):
+        command = SetPop(database=database, key=b"a", count=-1)
+
+        with pytest.raises(ServerError) as error:
+            command.execute()
+
+        assert error.value.message == b"ERR value is out of range, must be positive"
+        assert database.get_set(b"a") == {b"1", b"2", b"3"}
+
+
+class TestSetUnionStore:
+    def test_parse(self):
+        assert SetUnionStore.parse([b"dst", b"a", b"b"]) == {"destination": b"dst", "keys": [b"a", b"b"]}
+
+    def test_execute(self, database):
+        command = SetUnionStore(database=database, destination=b"dst", keys=[b"a", b"b"])
+
+        assert command.execute() == 4
+        assert database.get_set(b"dst") == {b"1", b"2", b"3", b"4"}
+
+
+class TestSetIntersectionStore:
+    def test_execute(self, database):
+        command = SetIntersectionStore(database=database, destination=b"dst", keys=[b"a", b"b"])
+
+        assert command.execute() == 2
+        assert database.get_set(b"dst") == {b"2", b"3"}
+
+    def test_execute_empty_result_removes_destination(self, database):
+        database.data[b"dst"] = KeyValue(b"dst", {b"old"})
+        command = SetIntersectionStore(database=database, destination=b"dst", keys=[b"a", b"c"])
+
+        assert command.execute() == 0
+        assert b"dst" not in database.data
+
+
+class TestSetDifferenceStore:
+    def test_execute(self, database):
+        command = SetDifferenceStore(database=database, destination=b"dst", keys=[b"a", b"b"])
+
+        assert command.execute() == 1
+        assert database.get_set(b"dst") == {b"1"}
+
+    def test_execute_empty_result_removes_destination(self, database):
+        database.data[b"dst"] = KeyValue(b"dst", {b"old"})
+        command = SetDifferenceStore(database=database, destination=b"dst", keys=[b"a", b"a"])
+
+        assert command.execute() == 0
+        assert b"dst" not in database.data
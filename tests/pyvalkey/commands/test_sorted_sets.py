@@ -0,0 +1,185 @@
+import pytest
+
+from pyvalkey.commands.sorted_sets import (
+    RangeMode,
+    SortedSetAdd,
+    SortedSetCount,
+    SortedSetRange,
+    SortedSetRangeByScore,
+    SortedSetRangeStore,
+    SortedSetRank,
+    SortedSetReversedRange,
+    SortedSetReversedRangeByLexical,
+    SortedSetReversedRangeByScore,
+    SortedSetReversedRank,
+)
+from pyvalkey.database_objects.databases import Database, RangeLimit
+from pyvalkey.database_objects.errors import ServerError
+
+
+@pytest.fixture
+def database() -> Database:
+    database = Database()
+    database.get_or_create_sorted_set(b"z").add_many([(1, b"a"), (2, b"b"), (3, b"c"), (4, b"d")])
+    database.get_or_create_sorted_set(b"lex").add_many([(0, b"a"), (0, b"b"), (0, b"c"), (0, b"d")])
+    return database
+
+
+class TestSortedSetAdd:
+    def test_parse(self):
+        assert SortedSetAdd.parse([b"z", b"1", b"a", b"2.5", b"b"]) == {
+            "key": b"z",
+            "scores_members": [(1.0, b"a"), (2.5, b"b")],
+        }
+
+    @pytest.mark.parametrize(
+        ("score", "expected"), [(b"+inf", float("inf")), (b"-inf", float("-inf")), (b"1e2", 100.0)]
+    )
+    def test_parse_special_score(self, score, expected):
+        assert SortedSetAdd.parse([b"z", score, b"a"])["scores_members"] == [(expected, b"a")]
+
+    @pytest.mark.parametrize("score", [b"nan", b"1_0", b" 2", b"2 ", b"abc"])
+    def test_parse_invalid_score(self, score):
+        with pytest.raises(ServerError) as error:
+            SortedSetAdd.parse([b"z", score, b"a"])
+        assert error.value.message == b"ERR value is not a valid float"
+
+    def test_execute_changed_counts_duplicate_new_member_once(self, database):
+        command = SortedSetAdd(
+            database=database, key=b"new", return_changed_elements=True, scores_members=[(1, b"x"), (2, b"x")]
+        )
+
+        assert command.execute() == 1
+        assert database.get_sorted_set(b"new").members_scores[b"x"] == 2
+
+    def test_execute_changed_counts_updates(self, database):
+        command = SortedSetAdd(
+            database=database, key=b"z", return_changed_elements=True, scores_members=[(1, b"a"), (5, b"b"), (6, b"e")]
+        )
+
+        assert command.execute() == 2
+
+
+class TestSortedSetRangeByScore:
+    @pytest.mark.parametrize("bound", [b"nan", b"(nan", b"1_0", b" 2", b"(2 ", b"abc"])
+    def test_execute_invalid_bound(self, database, bound):
+        command = SortedSetRangeByScore(database=database, key=b"z", min=bound, max=b"10")
+
+        with pytest.raises(ServerError) as error:
+            command.execute()
+        assert error.value.message == b"ERR min or max is not a float"
+
+
+class TestSortedSetCount:
+    def test_execute_nan_bound(self, database):
+        command = SortedSetCount(database=database, key=b"z", min=b"nan", max=b"1")
+
+        with pytest.raises(ServerError) as error:
+            command.execute()
+        assert error.value.message == b"ERR min or max is not a float"
+
+
+class TestSortedSetReversedRangeByScore:
+    def test_parse(self):
+        assert SortedSetReversedRangeByScore.parse([b"z", b"3", b"(1"]) == {"key": b"z", "max": b"3", "min": b"(1"}
+
+    def test_execute(self, database):
+        command = SortedSetReversedRangeByScore(database=database, key=b"z", max=b"3", min=b"(1")
+
+        assert command.execute() == [b"c", b"b"]
+
+    def test_execute_with_scores(self, database):
+        command = SortedSetReversedRangeByScore(database=database, key=b"z", max=b"+inf", min=b"-inf", with_scores=True)
+
+        assert command.execute() == [b"d", 4, b"c", 3, b"b", 2, b"a", 1]
+
+
+class TestSortedSetReversedRangeByLexical:
+    def test_parse(self):
+        assert SortedSetReversedRangeByLexical.parse([b"lex", b"[c", b"-"]) == {
+            "key": b"lex",
+            "max": b"[c",
+            "min": b"-",
+        }
+
+    def test_execute(self, database):
+        command = SortedSetReversedRangeByLexical(database=database, key=b"lex", max=b"[c", min=b"(a")
+
+        assert command.execute() == [b"c", b"b"]
+
+
+class TestSortedSetRange:
+    def test_parse_by_score_with_limit(self):
+        assert SortedSetRange.parse([b"z", b"1", b"4", b"BYSCORE", b"LIMIT", b"1", b"2"]) == {
+            "key": b"z",
+            "start": b"1",
+            "stop": b"4",
+            "range_mode": RangeMode.BY_SCORE,
+            "limit": RangeLimit(offset=1, count=2),
+        }
+
+    def test_execute_by_score_with_limit(self, database):
+        command = SortedSetRange(
+            database=database,
+            key=b"z",
+            start=b"1",
+            stop=b"4",
+            range_mode=RangeMode.BY_SCORE,
+            limit=RangeLimit(offset=1, count=2),
+        )
+
+        assert command.execute() == [b"b", b"c"]
+
+
+class TestSortedSetReversedRange:
+    def test_execute(self, database):
+        command = SortedSetReversedRange(database=database, key=b"z", start=b"0", stop=b"1")
+
+        assert command.execute() == [b"d", b"c"]
+
+    def test_execute_with_scores(self, database):
+        command = SortedSetReversedRange(database=database, key=b"z", start=b"-2", stop=b"-1", with_scores=True)
+
+        assert command.execute() == [b"b", 2, b"a", 1]
+
+
+class TestSortedSetRangeStore:
+    def test_execute(self, database):
+        command = SortedSetRangeStore(database=database, destination=b"dst", key=b"z", start=b"1", stop=b"2")
+
+        assert command.execute() == 2
+        assert database.get_sorted_set(b"dst").members_scores == {b"b": 2, b"c": 3}
+
+    def test_execute_empty_result_removes_destination(self, database):
+        database.get_or_create_sorted_set(b"dst").add_many([(1, b"old")])
+        command = SortedSetRangeStore(database=database, destination=b"dst", key=b"z", start=b"10", stop=b"20")
+
+        assert command.execute() == 0
+        assert b"dst" not in database.data
+
+
+class TestSortedSetRank:
+    def test_parse(self):
+        assert SortedSetRank.parse([b"z", b"c", b"WITHSCORE"]) == {"key": b"z", "member": b"c", "with_score": True}
+
+    def test_execute(self, database):
+        assert SortedSetRank(database=database, key=b"z", member=b"c").execute() == 2
+
+    def test_execute_with_score(self, database):
+        assert SortedSetRank(database=database, key=b"z", member=b"c", with_score=True).execute() == [2, 3]
+
+    def test_execute_missing_member(self, database):
+        assert SortedSetRank(database=database, key=b"z", member=b"x").execute() is None
+        assert SortedSetRank(database=database, key=b"z", member=b"x", with_score=True).execute() is None
+
+
+class TestSortedSetReversedRank:
+    def test_execute(self, database):
+        assert SortedSetReversedRank(database=database, key=b"z", member=b"c").execute() == 1
+
+    def test_execute_with_score(self, database):
+        assert SortedSetReversedRank(database=database, key=b"z", member=b"a", with_score=True).execute() == [3, 1]
+
+    def test_execute_missing_member(self, database):
+        assert SortedSetReversedRank(database=database, key=b"z", member=b"x").execute() is None
+        assert SortedSetReversedRank(database=database, key=b"missing", member=b"a", with_score=True).execute() is None